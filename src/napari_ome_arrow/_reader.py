@@ -7,13 +7,23 @@ Behavior:
       that choice is used.
     * Otherwise, in a GUI/Qt context, the user is prompted with a modal
       dialog asking whether to load as image or labels.
+    * OME-Zarr stores are returned lazily as dask-backed multiscale arrays
+      so napari only reads the chunks it displays. Set
+      NAPARI_OME_ARROW_EAGER=1 to load them through OMEArrow.export instead.
 """
 
 from __future__ import annotations
 
 import os
+import re
+import threading
 import warnings
+from collections import OrderedDict
 from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import IntFlag
+from functools import lru_cache, partial
+from math import isqrt, prod
 from pathlib import Path
 from typing import Any, Union
 
@@ -21,23 +31,32 @@ import numpy as np
 from ome_arrow.core import OMEArrow
 
 PathLike = Union[str, Path]
-LayerData = tuple[np.ndarray, dict[str, Any], str]
+# data may be a NumPy array, a dask array, or a list of arrays (multiscale)
+LayerData = tuple[Any, dict[str, Any], str]
 
+_TCZYX = "TCZYX"
+# .npy carries no axis metadata, so never guess a channel axis for it
+_NPY_DEFAULT_AXES = "TZYX"
 
-def _maybe_set_viewer_3d(arr: np.ndarray) -> None:
+
+def _display_name(src: str) -> str:
+    """
+    Final path component (like Path.name) without building a Path;
+    trailing separators are ignored so "plate.zarr/" gives "plate.zarr".
+    """
+    return os.path.basename(src.strip().rstrip("/" + os.sep))
+
+
+def _maybe_set_viewer_3d(arr: np.ndarray, axes: str) -> None:
     """
     If the array has a Z axis with size > 1, switch the current napari viewer
     to 3D (ndisplay = 3).
 
-    Assumes OME-Arrow's TCZYX convention or a subset, i.e., Z is always
-    the third-from-last axis. No-op if there's no active viewer.
+    `axes` names the dimensions of `arr` (e.g. "TCZYX" or "CYX"); arrays
+    without a "Z" axis are left alone. No-op if there's no active viewer.
     """
-    # Need at least (Z, Y, X)
-    if arr.ndim < 3:
-        return
-
-    z_size = arr.shape[-3]
-    if z_size <= 1:
+    z_axis = axes.find("Z")
+    if z_axis < 0 or arr.shape[z_axis] <= 1:
         return
 
     try:
@@ -101,7 +120,7 @@ def _get_layer_mode(sample_path: str) -> str:
     msg = QtWidgets.QMessageBox()
     msg.setWindowTitle("napari-ome-arrow: choose layer type")
     msg.setText(
-        f"<p align='left'>How should '{Path(sample_path).name}' be loaded?<br><br>"
+        f"<p align='left'>How should '{_display_name(sample_path)}' be loaded?<br><br>"
         "You can also set NAPARI_OME_ARROW_LAYER_TYPE=image or labels to skip this prompt.</p>"
     )
 
@@ -129,9 +148,33 @@ def _get_layer_mode(sample_path: str) -> str:
 # --------------------------------------------------------------------- #
 
 
+# elements per block when rounding float data to labels (4 MB of float32)
+_LABEL_BLOCK = 1 << 20
+
+
+def _float_to_labels(arr: np.ndarray) -> np.ndarray:
+    """
+    Round a C-contiguous float array to int32 labels (NaN/inf -> 0).
+
+    Works block by block straight into the output, so peak memory is the
+    int32 result plus one small scratch block rather than three
+    full-size temporaries from nan_to_num -> round -> astype.
+    """
+    out = np.empty(arr.shape, dtype=np.int32)
+    src, dst = arr.reshape(-1), out.reshape(-1)  # views, both contiguous
+    for start in range(0, src.size, _LABEL_BLOCK):
+        block = np.rint(src[start : start + _LABEL_BLOCK])
+        np.nan_to_num(block, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+        dst[start : start + _LABEL_BLOCK] = block
+    return out
+
+
 def _as_labels(arr: np.ndarray) -> np.ndarray:
     """Convert any array into an integer label array."""
     if arr.dtype.kind == "f":
+        if isinstance(arr, np.ndarray) and arr.flags.c_contiguous:
+            return _float_to_labels(arr)
+        # dask or strided input: whole-array ufuncs (dask stays lazy)
         arr = np.nan_to_num(arr, nan=0.0, posinf=0.0, neginf=0.0)
         arr = np.round(arr).astype(np.int32, copy=False)
     elif arr.dtype.kind not in ("i", "u"):
@@ -139,35 +182,391 @@ def _as_labels(arr: np.ndarray) -> np.ndarray:
     return arr
 
 
-def _looks_like_ome_source(path_str: str) -> bool:
-    """Basic extension / pattern sniffing for OME-Arrow supported formats."""
-    s = path_str.strip().lower()
-    p = Path(path_str)
+def _apply_layer_mode(
+    levels: list[Any], axes: str, mode: str, add_kwargs: dict[str, Any]
+) -> tuple[Any, str, str]:
+    """
+    Turn resolution levels with known `axes` into napari layer data.
 
-    looks_stack = any(c in path_str for c in "<>*")
-    looks_zarr = (
-        s.endswith((".ome.zarr", ".zarr"))
-        or ".zarr/" in s
-        or p.exists()
-        and p.is_dir()
-        and p.suffix.lower() == ".zarr"
-    )
-    looks_parquet = s.endswith(
-        (".ome.parquet", ".parquet", ".pq")
-    ) or p.suffix.lower() in {
-        ".parquet",
-        ".pq",
-    }
-    looks_tiff = s.endswith(
-        (".ome.tif", ".ome.tiff", ".tif", ".tiff")
-    ) or p.suffix.lower() in {
-        ".tif",
-        ".tiff",
-    }
-    looks_npy = s.endswith(".npy")
-    return (
-        looks_stack or looks_zarr or looks_parquet or looks_tiff or looks_npy
+    Image mode exposes the "C" axis (if any) as `channel_axis`; labels mode
+    keeps the first channel and casts to an integer dtype. Returns
+    (data, layer_type, data_axes), where a multi-level list stays a
+    multiscale list and `data_axes` drops "C" when labels squash it.
+    """
+    c_axis = axes.find("C")
+    if mode == "image":
+        # Image: preserve channels
+        if c_axis >= 0:
+            add_kwargs["channel_axis"] = c_axis
+        layer_type = "image"
+    else:
+        # Labels: squash channels (view, no copy), ensure integer dtype
+        if c_axis >= 0:
+            first = (slice(None),) * c_axis + (0,)
+            levels = [a[first] for a in levels]
+            axes = axes.replace("C", "")
+        levels = [_as_labels(a) for a in levels]
+        add_kwargs.setdefault("opacity", 0.7)
+        layer_type = "labels"
+
+    # napari treats a list of arrays as a multiscale pyramid
+    data = levels if len(levels) > 1 else levels[0]
+    return data, layer_type, axes
+
+
+def _npy_axes(arr: np.ndarray) -> str:
+    """
+    Axes for a bare .npy, which carries no axis metadata.
+
+    Uses NAPARI_OME_ARROW_NPY_AXES (e.g. "CYX") when set. Otherwise no
+    channel axis is assumed: up to 4D the trailing TZYX subset matching
+    the array rank is used (a 3D array is a ZYX stack, a 4D one TZYX),
+    and higher ranks get no named axes.
+    """
+    axes = os.environ.get("NAPARI_OME_ARROW_NPY_AXES")
+    if axes is None:
+        return _NPY_DEFAULT_AXES[-arr.ndim :] if arr.ndim <= 4 else ""
+
+    axes = axes.strip().upper()
+    if len(axes) != arr.ndim or len(set(axes)) != len(axes):
+        raise ValueError(
+            f"NAPARI_OME_ARROW_NPY_AXES={axes!r} does not describe an array "
+            f"of shape {arr.shape}."
+        )
+    return axes
+
+
+def _env_flag(name: str) -> bool:
+    """True if the boolean environment variable `name` is switched on."""
+    return os.environ.get(name, "").strip().lower() in {"1", "true", "yes"}
+
+
+# OME pixel type names that differ from NumPy's spelling
+_OME_PIXEL_DTYPES = {
+    "float": np.float32,
+    "double": np.float64,
+    "bit": np.uint8,
+}
+
+
+def _source_meta(obj: OMEArrow) -> tuple[tuple[int, ...], np.dtype]:
+    """
+    TCZYX shape and pixel dtype from a single read of the record's
+    `pixels_meta`.
+
+    OMEArrow.info() reports the same shape but converts the whole record
+    (pixel payload included) to Python objects, so it is only used as a
+    fallback. The dtype lets export skip a full-volume cast; set
+    NAPARI_OME_ARROW_FORCE_U16=1 to keep the previous uint16 output.
+    Unknown pixel types fall back to uint16.
+    """
+    try:
+        pm = obj.data["pixels_meta"].as_py()
+        shape = tuple(int(pm[f"size_{a.lower()}"]) for a in _TCZYX)
+        name = str(pm.get("type") or "uint16").lower()
+    except Exception:
+        shape, name = tuple(obj.info()["shape"]), "uint16"
+
+    if _env_flag("NAPARI_OME_ARROW_FORCE_U16"):
+        name = "uint16"
+    try:
+        dtype = np.dtype(_OME_PIXEL_DTYPES.get(name, name))
+    except TypeError:
+        dtype = np.dtype(np.uint16)
+    return shape, dtype
+
+
+# bytes of decoded chunks each prefetching zarr array (one pyramid level of
+# one layer) may keep; common NGFF chunks are tens of MB each
+_PREFETCH_CACHE_BYTES = 128 << 20
+
+_PREFETCH_POOL: ThreadPoolExecutor | None = None
+_PREFETCH_POOL_LOCK = threading.Lock()
+
+
+def _prefetch_pool() -> ThreadPoolExecutor:
+    """Small background pool shared by all prefetching zarr arrays."""
+    global _PREFETCH_POOL
+    with _PREFETCH_POOL_LOCK:
+        if _PREFETCH_POOL is None:
+            _PREFETCH_POOL = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="napari-ome-arrow-prefetch"
+            )
+        return _PREFETCH_POOL
+
+
+class _PrefetchingZarr:
+    """
+    Read-only zarr array wrapper that warms neighbouring chunks.
+
+    After each chunk read, chunks up to `max_distance[axis]` chunk steps
+    away along every axis are fetched on a background pool. At most
+    `max_chunks` prefetches are in flight per array, and queued ones that
+    fall out of range of the latest read are cancelled, so scrubbing a
+    slider never builds a backlog that competes with foreground reads (or
+    that the pool must drain at interpreter exit). Foreground and prefetch
+    reads share an LRU chunk cache bounded to `cache_bytes` (prefetching is
+    capped to what fits in it), so moving a T/Z slider usually hits memory
+    instead of blocking on storage; a foreground read of a chunk that is
+    already being prefetched waits for that read instead of issuing a
+    second one. Meant to be wrapped with dask.array.from_array using the
+    zarr chunk grid, so every __getitem__ is one chunk.
+    """
+
+    def __init__(
+        self,
+        inner: Any,
+        max_distance: tuple[int, ...],
+        max_chunks: int = 8,
+        cache_bytes: int = _PREFETCH_CACHE_BYTES,
+    ) -> None:
+        self.inner = inner
+        self.shape = tuple(inner.shape)
+        self.dtype = inner.dtype
+        self.ndim = len(self.shape)
+        self.chunks = tuple(inner.chunks)
+        self._max_distance = max_distance
+        # prefetching more than the cache holds would only evict the
+        # chunk being displayed
+        chunk_nbytes = max(
+            prod(self.chunks) * np.dtype(self.dtype).itemsize, 1
+        )
+        self._max_chunks = max(
+            0, min(max_chunks, cache_bytes // chunk_nbytes - 1)
+        )
+        self._cache_bytes = cache_bytes
+        self._cached_nbytes = 0
+        self._cache: OrderedDict[tuple, np.ndarray] = OrderedDict()
+        self._pending: dict[tuple, Future] = {}
+        self._lock = threading.Lock()
+
+    def _block_key(self, key: Any) -> tuple | None:
+        """(start, stop) per axis, or None for keys we do not cache."""
+        if not isinstance(key, tuple) or len(key) != self.ndim:
+            return None
+        if not all(isinstance(k, slice) and k.step in (None, 1) for k in key):
+            return None
+        return tuple(
+            k.indices(n)[:2] for k, n in zip(key, self.shape, strict=True)
+        )
+
+    def _read(self, block: tuple) -> np.ndarray:
+        with self._lock:
+            if block in self._cache:
+                self._cache.move_to_end(block)
+                return self._cache[block]
+        data = np.asarray(self.inner[tuple(slice(a, b) for a, b in block)])
+        with self._lock:
+            stale = self._cache.pop(block, None)  # racing duplicate read
+            if stale is not None:
+                self._cached_nbytes -= stale.nbytes
+            self._cache[block] = data
+            self._cached_nbytes += data.nbytes
+            # always keep the newest chunk, even if it alone exceeds budget
+            while (
+                self._cached_nbytes > self._cache_bytes
+                and len(self._cache) > 1
+            ):
+                _, evicted = self._cache.popitem(last=False)
+                self._cached_nbytes -= evicted.nbytes
+        return data
+
+    def _prefetch(self, block: tuple) -> None:
+        try:
+            self._read(block)
+        except Exception:
+            # best effort: a failed prefetch is retried by the foreground
+            pass
+        finally:
+            with self._lock:
+                self._pending.pop(block, None)
+
+    def _neighbours(self, block: tuple) -> list[tuple]:
+        """Chunk-aligned blocks near `block`, nearest first."""
+        found = []
+        for step in range(1, max(self._max_distance, default=0) + 1):
+            for axis, reach in enumerate(self._max_distance):
+                if step > reach:
+                    continue
+                size, n = self.chunks[axis], self.shape[axis]
+                for sign in (1, -1):
+                    start = block[axis][0] + sign * step * size
+                    if 0 <= start < n:
+                        shifted = list(block)
+                        shifted[axis] = (start, min(start + size, n))
+                        found.append(tuple(shifted))
+        return found
+
+    def __getitem__(self, key: Any) -> np.ndarray:
+        block = self._block_key(key)
+        if block is None:
+            return np.asarray(self.inner[key])
+
+        self._await_prefetch(block)
+        data = self._read(block)
+        self._schedule(self._neighbours(block)[: self._max_chunks])
+        return data
+
+    def _await_prefetch(self, block: tuple) -> None:
+        """Wait for an in-flight prefetch of `block` rather than reread it."""
+        with self._lock:
+            future = self._pending.get(block)
+            if future is None:
+                return
+            if future.cancel():
+                # still queued: cheaper to read it here than to wait
+                del self._pending[block]
+                return
+        # running (or just finished); _prefetch never raises
+        future.result()
+
+    def _schedule(self, wanted: list[tuple]) -> None:
+        """Cancel stale prefetches, then queue `wanted` up to the cap."""
+        pool = _prefetch_pool()
+        keep = set(wanted)
+        with self._lock:
+            for nb, future in list(self._pending.items()):
+                # running reads cannot be cancelled and still count
+                if nb not in keep and future.cancel():
+                    del self._pending[nb]
+            for nb in wanted:
+                if len(self._pending) >= self._max_chunks:
+                    break
+                if nb in self._cache or nb in self._pending:
+                    continue
+                self._pending[nb] = pool.submit(self._prefetch, nb)
+
+
+def _open_ome_zarr_multiscale(src: str) -> list[Any] | None:
+    """
+    Open an OME-Zarr store as a list of lazy dask arrays, one per
+    resolution level (highest resolution first).
+
+    Each level is expanded to the TCZYX convention used by OME-Arrow so
+    downstream channel/label handling matches the eager path, and cast
+    lazily to uint16 when NAPARI_OME_ARROW_FORCE_U16 is set. Returns None
+    if the store lacks usable NGFF multiscales metadata, in which case the
+    caller should fall back to OMEArrow.
+    """
+    import dask.array as da
+    import zarr
+    from dask.base import tokenize
+
+    try:
+        group = zarr.open_group(src.rstrip("/"), mode="r")
+    except Exception:
+        return None
+
+    attrs = group.attrs.asdict()
+    # NGFF 0.5 nests metadata under "ome"; 0.4 keeps it at the top level
+    multiscales = attrs.get("ome", attrs).get("multiscales")
+    if not multiscales:
+        return None
+
+    ms = multiscales[0]
+    axes = "".join(
+        (ax["name"] if isinstance(ax, dict) else ax).upper()
+        for ax in ms.get("axes", [])
     )
+    # Only accept axes that are an ordered subset of TCZYX
+    if not axes or axes != "".join(a for a in _TCZYX if a in axes):
+        return None
+
+    missing = tuple(i for i, a in enumerate(_TCZYX) if a not in axes)
+    # Warm adjacent planes along T and Z, the axes napari scrolls through
+    max_distance = tuple({"T": 1, "Z": 2}.get(a, 0) for a in axes)
+    force_u16 = _env_flag("NAPARI_OME_ARROW_FORCE_U16")
+    levels = []
+    for ds in ms.get("datasets", []):
+        array = group[ds["path"]]
+        if array.ndim != len(axes):
+            return None
+        level = da.from_array(
+            _PrefetchingZarr(array, max_distance=max_distance),
+            chunks=array.chunks,
+            name=f"ome-zarr-{tokenize(src, ds['path'])}",
+            fancy=False,
+            meta=np.empty((0,) * array.ndim, dtype=array.dtype),
+        )
+        if missing:
+            level = da.expand_dims(level, axis=missing)
+        if force_u16:
+            level = level.astype(np.uint16)  # per chunk, on read
+        levels.append(level)
+    return levels or None
+
+
+# --------------------------------------------------------------------- #
+#  Source classification (shared by napari_get_reader and _read_one)
+# --------------------------------------------------------------------- #
+
+
+class _Kind(IntFlag):
+    """Bit-packed source kinds; stack patterns may combine with a suffix."""
+
+    NONE = 0
+    STACK = 1
+    ZARR = 2
+    PARQUET = 4
+    TIFF = 8
+    NPY = 16
+
+    # kinds _read_one sends through OMEArrow
+    OME_ARROW = STACK | ZARR | PARQUET | TIFF
+    # kinds napari_get_reader claims; drop a flag here to stop dispatching
+    # it without touching the classifier or the reader
+    READABLE = OME_ARROW | NPY
+
+
+# Known suffixes in one alternation; each group is named after its _Kind
+# member and ".ome.*" variants share the final extension's group.
+# Trailing whitespace is tolerated, as napari paths may arrive unstripped.
+_SUFFIX_RE = re.compile(
+    r"\.(?:(?P<ZARR>zarr)/?|(?P<PARQUET>parquet|pq)|(?P<TIFF>tiff?)|(?P<NPY>npy))\s*$",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=1024)
+def _classify(path_str: str) -> _Kind:
+    """
+    Basic extension / pattern sniffing for OME-Arrow supported formats.
+
+    Pure string inspection (no filesystem access), so results are safe to
+    memoize across napari's repeated probes of the same path.
+    """
+    m = _SUFFIX_RE.search(path_str)
+    if m:
+        kind = _Kind[m.lastgroup]
+    elif ".zarr/" in path_str.lower():
+        kind = _Kind.ZARR
+    else:
+        kind = _Kind.NONE
+
+    # unrolled substring tests beat any() over a generator and translate()
+    if "<" in path_str or ">" in path_str or "*" in path_str:
+        kind |= _Kind.STACK
+    return kind
+
+
+def _source_kind(path_str: str) -> _Kind:
+    """
+    Classify a path, touching the filesystem only when its name is
+    ambiguous. A directory without a recognized suffix is treated as
+    OME-Zarr if it carries zarr group metadata. Not cached, so a store
+    created after the first probe is still picked up.
+    """
+    kind = _classify(path_str)
+    if kind:
+        return kind
+
+    path_str = path_str.strip()
+    if os.path.isdir(path_str) and any(
+        os.path.isfile(os.path.join(path_str, meta))
+        for meta in ("zarr.json", ".zgroup")
+    ):
+        return _Kind.ZARR
+    return _Kind.NONE
 
 
 # --------------------------------------------------------------------- #
@@ -182,9 +581,9 @@ def napari_get_reader(path: Union[PathLike, Sequence[PathLike]]):
     This MUST return a function object (e.g. `reader_function`) or None.
     """
     # napari may pass a list/tuple or a single path
-    first = str(path[0] if isinstance(path, (list, tuple)) else path).strip()
+    first = os.fspath(path[0] if isinstance(path, (list, tuple)) else path)
 
-    if _looks_like_ome_source(first):
+    if _source_kind(first) & _Kind.READABLE:
         return reader_function
     return None
 
@@ -194,106 +593,72 @@ def napari_get_reader(path: Union[PathLike, Sequence[PathLike]]):
 # --------------------------------------------------------------------- #
 
 
-def _read_one(src: str, mode: str) -> LayerData:
+def _read_one(src: str, mode: str) -> tuple[LayerData, str]:
     """
-    Read a single source into (data, add_kwargs, layer_type),
-    obeying `mode` = 'image' or 'labels'.
+    Read a single source into ((data, add_kwargs, layer_type), axes),
+    obeying `mode` = 'image' or 'labels'. `axes` names the dimensions of
+    `data` (of each level, for multiscale data).
+
+    May run on a worker thread, so it must not touch the napari viewer.
     """
-    s = src.lower()
-    p = Path(src)
-
-    looks_stack = any(c in src for c in "<>*")
-    looks_zarr = (
-        s.endswith((".ome.zarr", ".zarr"))
-        or ".zarr/" in s
-        or p.exists()
-        and p.is_dir()
-        and p.suffix.lower() == ".zarr"
-    )
-    looks_parquet = s.endswith(
-        (".ome.parquet", ".parquet", ".pq")
-    ) or p.suffix.lower() in {
-        ".parquet",
-        ".pq",
-    }
-    looks_tiff = s.endswith(
-        (".ome.tif", ".ome.tiff", ".tif", ".tiff")
-    ) or p.suffix.lower() in {
-        ".tif",
-        ".tiff",
-    }
-    looks_npy = s.endswith(".npy")
-
-    add_kwargs: dict[str, Any] = {"name": p.name}
+    kind = _source_kind(src)
+    add_kwargs: dict[str, Any] = {"name": _display_name(src)}
 
     # ---- OME-Arrow-backed sources -----------------------------------
-    if looks_stack or looks_zarr or looks_parquet or looks_tiff:
-        obj = OMEArrow(src)
-        arr = obj.export(how="numpy", dtype=np.uint16)  # TCZYX
-        info = obj.info()  # may contain 'shape': (T, C, Z, Y, X)
-
-        # Recover from accidental 1D flatten
-        if getattr(arr, "ndim", 0) == 1:
-            T, C, Z, Y, X = info.get("shape", (1, 1, 1, 0, 0))
-            if Y and X and arr.size == Y * X:
-                arr = arr.reshape((1, 1, 1, Y, X))
-            else:
-                raise ValueError(
-                    f"Flat array with unknown shape for {src}: size={arr.size}"
-                )
-
-        if mode == "image":
-            # Image: preserve channels
-            if arr.ndim >= 5:
-                add_kwargs["channel_axis"] = 1  # TCZYX
-            elif arr.ndim == 4:
-                add_kwargs["channel_axis"] = 0  # CZYX
-            layer_type = "image"
-        else:
-            # Labels: squash channels, ensure integer dtype
-            if arr.ndim == 5:  # (T, C, Z, Y, X)
-                arr = arr[:, 0, ...]
-            elif arr.ndim == 4:  # (C, Z, Y, X)
-                arr = arr[0, ...]
-            arr = _as_labels(arr)
-            add_kwargs.setdefault("opacity", 0.7)
-            layer_type = "labels"
-
-        # 🔹 Ask viewer to switch to 3D if there is a real Z-stack
-        _maybe_set_viewer_3d(arr)
-
-        return arr, add_kwargs, layer_type
+    if kind & _Kind.OME_ARROW:
+        levels = None
+        if kind & _Kind.ZARR and not _env_flag("NAPARI_OME_ARROW_EAGER"):
+            # Lazy multiscale: napari only pulls on-screen chunks
+            levels = _open_ome_zarr_multiscale(src)
+
+        if levels is None:
+            obj = OMEArrow(src)
+            shape, dtype = _source_meta(obj)
+            arr = obj.export(how="numpy", dtype=dtype)
+            # export always yields dense, C-contiguous (T, C, Z, Y, X), so
+            # no reshape (and no hidden copy) is needed
+            assert arr.shape == shape, f"expected {shape}, got {arr.shape}"
+            assert arr.flags.c_contiguous, "expected C-contiguous export"
+            levels = [arr]
+
+        # Every level follows TCZYX
+        data, layer_type, axes = _apply_layer_mode(
+            levels, _TCZYX, mode, add_kwargs
+        )
+        return (data, add_kwargs, layer_type), axes
 
     # ---- bare .npy fallback -----------------------------------------
-    if looks_npy:
-        arr = np.load(src)
+    if kind & _Kind.NPY:
+        # Memory-map so only the pages napari displays are read from disk.
+        # The memmap (or a view of it) is handed to napari as-is; avoid
+        # np.asarray / ascontiguousarray / astype here, which would load it.
+        # Labels stay editable: copy-on-write pages are private, so
+        # painting never writes back to the file.
+        mmap_mode = "c" if mode == "labels" else "r"
+        arr = np.load(src, mmap_mode=mmap_mode, allow_pickle=False)
         if arr.ndim == 1:
-            n = int(np.sqrt(arr.size))
-            if n * n == arr.size:
-                arr = arr.reshape(n, n)
-            else:
+            n = isqrt(arr.size)  # exact; float sqrt drifts near 2**52
+            if n * n != arr.size:
                 raise ValueError(
                     f".npy is 1D and not a square image: {arr.shape}"
                 )
+            # a mapped 1D .npy is always contiguous, so this is a view
+            arr = arr.reshape(n, n)
 
-        if mode == "image":
-            if arr.ndim == 3 and arr.shape[0] <= 6:
-                add_kwargs["channel_axis"] = 0
-            layer_type = "image"
-        else:
-            # labels
-            if arr.ndim == 3:  # treat as (C, Y, X) → first channel
-                arr = arr[0, ...]
-            arr = _as_labels(arr)
-            add_kwargs.setdefault("opacity", 0.7)
-            layer_type = "labels"
+        data, layer_type, axes = _apply_layer_mode(
+            [arr], _npy_axes(arr), mode, add_kwargs
+        )
+        return (data, add_kwargs, layer_type), axes
 
-        # 🔹 Same 3D toggle for npy-based data
-        _maybe_set_viewer_3d(arr)
+    raise ValueError(f"Unrecognized path for napari-ome-arrow reader: {src}")
 
-        return arr, add_kwargs, layer_type
 
-    raise ValueError(f"Unrecognized path for napari-ome-arrow reader: {src}")
+def _load_one(src: str, mode: str) -> tuple[LayerData, str] | Exception:
+    """Read one source, returning the exception instead of raising it."""
+    try:
+        return _read_one(src, mode=mode)
+    except Exception as e:
+        return e
 
 
 def reader_function(
@@ -304,11 +669,11 @@ def reader_function(
 
     It reads one or more paths, prompting the user (or using the env var)
     to decide 'image' vs 'labels', and returns a list of LayerData tuples.
+    Multiple paths are read concurrently; layer order follows `path`.
     """
-    paths: list[str] = [
-        str(p) for p in (path if isinstance(path, (list, tuple)) else [path])
-    ]
-    layers: list[LayerData] = []
+    raw_paths = path if isinstance(path, (list, tuple)) else (path,)
+    # os.fspath returns str inputs unchanged and unwraps Path objects once
+    paths: list[str] = [os.fspath(p) for p in raw_paths]
 
     # Use the first path as context for the dialog label
     try:
@@ -317,14 +682,37 @@ def reader_function(
         # If user canceled the dialog, propagate a clean error for napari
         raise ValueError(str(e)) from e
 
-    for src in paths:
-        try:
-            layers.append(_read_one(src, mode=mode))
-        except Exception as e:
-            warnings.warn(
-                f"Failed to read '{src}' with napari-ome-arrow: {e}",
-                stacklevel=2,
-            )
+    if len(paths) == 1:
+        results = [_load_one(paths[0], mode)]
+    else:
+        # Reads are I/O-bound and release the GIL in the tiff/zarr codecs
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as ex:
+            results = list(ex.map(partial(_load_one, mode=mode), paths))
+
+    layers: list[LayerData] = []
+    layer_axes: list[str] = []
+    failures: list[tuple[str, Exception]] = []
+    for src, result in zip(paths, results, strict=True):
+        if isinstance(result, Exception):
+            failures.append((src, result))
+        else:
+            layers.append(result[0])
+            layer_axes.append(result[1])
+
+    if failures:
+        # one aggregated warning rather than one per unreadable path
+        shown = "; ".join(f"'{src}': {e}" for src, e in failures[:10])
+        more = f"; and {len(failures) - 10} more" if len(failures) > 10 else ""
+        warnings.warn(
+            f"napari-ome-arrow skipped {len(failures)} unreadable "
+            f"input(s): {shown}{more}",
+            stacklevel=2,
+        )
+
+    for (data, _, _), axes in zip(layers, layer_axes, strict=True):
+        # 🔹 Ask viewer to switch to 3D if there is a real Z-stack
+        # (done here, on the calling thread, since it touches Qt)
+        _maybe_set_viewer_3d(data[0] if isinstance(data, list) else data, axes)
 
     if not layers:
         raise ValueError("No readable inputs found for given path(s).")
@@ -4,8 +4,11 @@ Tests for the napari-ome-arrow reader.
 
 from __future__ import annotations
 
+import concurrent.futures
 import contextlib
 import os
+import threading
+import time
 from pathlib import Path
 
 import numpy as np
@@ -58,6 +61,46 @@ def test_get_reader_returns_none_for_unsupported_extension():
     assert reader is None
 
 
+@pytest.mark.parametrize(
+    "path",
+    [
+        "image.ome.tiff",
+        "image.OME.TIF",
+        "image.tiff",
+        "plate.ome.zarr",
+        "plate.zarr/",
+        "plate.zarr/0",
+        "cells.ome.parquet",
+        "cells.pq",
+        "array.npy",
+        "stack_C<111,222>_ZS<000-021>.tif",
+        "  padded.tif  ",
+    ],
+)
+def test_get_reader_accepts_supported_paths(path: str):
+    """Reader should claim every supported suffix and stack pattern."""
+    assert napari_get_reader(path) is not None
+    # repeated probes hit the cached classification and agree
+    assert napari_get_reader([path, "other.file"]) is not None
+
+
+def test_get_reader_suffixless_zarr_directory(tmp_path: Path):
+    """
+    Directories without a recognized suffix are only claimed when they
+    contain zarr group metadata.
+    """
+    plain = tmp_path / "plain"
+    plain.mkdir()
+    assert napari_get_reader(str(plain)) is None
+
+    store = tmp_path / "store"
+    store.mkdir()
+    (store / "zarr.json").write_text(
+        '{"zarr_format": 3, "node_type": "group"}'
+    )
+    assert callable(napari_get_reader(str(store)))
+
+
 # --------------------------------------------------------------------- #
 #  Image mode: OME-Arrow sources
 # --------------------------------------------------------------------- #
@@ -109,6 +152,127 @@ def test_reader_image_mode_ome_sources(path: str, expect_multi_channel: bool):
             assert 0 <= axis < data.ndim
 
 
+@pytest.mark.parametrize(
+    "name",
+    ["single-channel.ome.tiff", "multi-channel.ome.tiff", "z-series.ome.tiff"],
+)
+def test_reader_image_mode_preserves_source_dtype(name: str):
+    """
+    Image data should keep the pixel type recorded by OME-Arrow rather
+    than being recast to a fixed dtype.
+    """
+    from ome_arrow.core import OMEArrow
+
+    path = _p("ome-artificial-5d-datasets", name)
+    source_type = OMEArrow(path).data["pixels_meta"]["type"].as_py()
+
+    with temporary_env_var("NAPARI_OME_ARROW_LAYER_TYPE", "image"):
+        data, _, _ = napari_get_reader(path)(path)[0]
+
+    assert data.dtype == np.dtype(source_type)
+
+
+def _write_ome_parquet(path: Path, arr: np.ndarray, type_name: str) -> None:
+    """
+    Write a (C, Z, Y, X) array as a single-row OME-Arrow parquet file that
+    keeps its pixel type (OMEArrow.export clamps pixels to uint16).
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from ome_arrow.ingest import from_numpy
+
+    scalar = from_numpy(
+        arr[np.newaxis],
+        dim_order="TCZYX",
+        clamp_to_uint16=False,
+        dtype_meta=type_name,
+    )
+    table = pa.table(
+        {"ome_arrow": pa.array([scalar.as_py()], type=scalar.type)}
+    )
+    pq.write_table(table, path)
+
+
+@pytest.mark.parametrize(
+    "source_dtype, type_name, force_u16, expected",
+    [
+        (np.uint8, "uint8", None, np.uint8),
+        # OME spells float32 as "float"
+        (np.float32, "float", None, np.float32),
+        (np.float32, "float", "1", np.uint16),
+    ],
+)
+def test_reader_image_mode_non_uint16_source(
+    tmp_path: Path,
+    source_dtype: type,
+    type_name: str,
+    force_u16: str | None,
+    expected: type,
+):
+    """
+    Non-uint16 sources keep their pixel type (mapped from the OME name),
+    unless NAPARI_OME_ARROW_FORCE_U16 asks for the previous uint16 output.
+    """
+    path = tmp_path / "pixels.ome.parquet"
+    original = (np.arange(2 * 3 * 8 * 8) % 200).astype(source_dtype)
+    original = original.reshape(2, 3, 8, 8)
+    _write_ome_parquet(path, original, type_name)
+
+    with (
+        temporary_env_var("NAPARI_OME_ARROW_LAYER_TYPE", "image"),
+        temporary_env_var("NAPARI_OME_ARROW_FORCE_U16", force_u16),
+    ):
+        data, add_kwargs, _ = napari_get_reader(str(path))(str(path))[0]
+
+    assert data.dtype == np.dtype(expected)
+    assert add_kwargs["channel_axis"] == 1
+    np.testing.assert_array_equal(data[0], original.astype(expected))
+
+
+def test_reader_multiple_paths_preserve_order():
+    """
+    Several paths read concurrently should come back in input order, with
+    unreadable inputs skipped rather than aborting the whole load.
+    """
+    paths = [
+        _p("ome-artificial-5d-datasets", "z-series.ome.tiff"),
+        _p("ome-artificial-5d-datasets", "missing.ome.tiff"),
+        _p("ome-artificial-5d-datasets", "single-channel.ome.tiff"),
+        _p("ome-artificial-5d-datasets", "multi-channel.ome.tiff"),
+    ]
+
+    with (
+        temporary_env_var("NAPARI_OME_ARROW_LAYER_TYPE", "image"),
+        pytest.warns(UserWarning, match="missing.ome.tiff"),
+    ):
+        layer_data_list = napari_get_reader(paths)(paths)
+
+    names = [add_kwargs["name"] for _, add_kwargs, _ in layer_data_list]
+    assert names == [
+        "z-series.ome.tiff",
+        "single-channel.ome.tiff",
+        "multi-channel.ome.tiff",
+    ]
+
+
+def test_reader_failures_emit_one_warning(tmp_path: Path):
+    """Several unreadable paths should produce a single summary warning."""
+    good = tmp_path / "good.npy"
+    np.save(good, np.zeros((8, 8), dtype=np.uint8))
+    paths = [str(good)] + [str(tmp_path / f"bad{i}.npy") for i in range(3)]
+
+    with (
+        temporary_env_var("NAPARI_OME_ARROW_LAYER_TYPE", "image"),
+        pytest.warns(UserWarning, match="skipped 3") as record,
+    ):
+        layer_data_list = napari_get_reader(paths)(paths)
+
+    assert len(layer_data_list) == 1
+    ours = [w for w in record if "napari-ome-arrow" in str(w.message)]
+    assert len(ours) == 1
+    assert all(p in str(ours[0].message) for p in paths[1:])
+
+
 # --------------------------------------------------------------------- #
 #  Labels mode: OME-Arrow sources
 # --------------------------------------------------------------------- #
@@ -143,6 +307,267 @@ def test_reader_labels_mode_ome_sources(path: str):
     assert "channel_axis" not in add_kwargs
 
 
+# --------------------------------------------------------------------- #
+#  Lazy OME-Zarr multiscale
+# --------------------------------------------------------------------- #
+
+
+def test_reader_ome_zarr_is_lazy_multiscale():
+    """
+    OME-Zarr stores should come back as a list of lazy TCZYX dask arrays
+    (one per pyramid level) rather than an eager NumPy array.
+    """
+    da = pytest.importorskip("dask.array")
+    path = _p("idr0062A", "6001240_labels.zarr")
+
+    with temporary_env_var("NAPARI_OME_ARROW_LAYER_TYPE", "image"):
+        reader = napari_get_reader(path)
+        assert callable(reader)
+        data, add_kwargs, layer_type = reader(path)[0]
+
+    assert layer_type == "image"
+    assert isinstance(data, list)
+    assert len(data) > 1
+    assert all(isinstance(level, da.Array) for level in data)
+    assert all(level.ndim == 5 for level in data)
+    assert add_kwargs["channel_axis"] == 1
+
+
+def test_reader_ome_zarr_plane_reads_match_store():
+    """
+    Z-plane reads through the prefetching wrapper (including neighbours
+    served from its cache) should match the zarr store exactly.
+    """
+    zarr = pytest.importorskip("zarr")
+    path = _p("idr0062A", "6001240_labels.zarr")
+    store_level = zarr.open_group(path, mode="r")["0"]  # (C, Z, Y, X)
+
+    with temporary_env_var("NAPARI_OME_ARROW_LAYER_TYPE", "image"):
+        data, _, _ = napari_get_reader(path)(path)[0]
+
+    level = data[0]  # (T, C, Z, Y, X)
+    for z in (100, 101, 99, 102):
+        np.testing.assert_array_equal(
+            level[0, 1, z].compute(), store_level[1, z]
+        )
+
+
+class _RecordingArray:
+    """
+    Zarr-like array that records the keys it is read with; reads from
+    prefetch threads wait on `gate` so tests can hold them in flight.
+    """
+
+    def __init__(self, data: np.ndarray, chunks: tuple[int, ...]):
+        self.data = data
+        self.shape = data.shape
+        self.dtype = data.dtype
+        self.chunks = chunks
+        self.keys: list[tuple] = []
+        self.prefetch_started: list[tuple] = []
+        self.prefetch_reads = 0
+        self.gate = threading.Event()
+        self.gate.set()
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key):
+        if threading.current_thread().name.startswith(
+            "napari-ome-arrow-prefetch"
+        ):
+            with self._lock:
+                self.prefetch_reads += 1
+                self.prefetch_started.append(
+                    tuple((k.start, k.stop) for k in key)
+                )
+            self.gate.wait(timeout=10)
+        with self._lock:
+            self.keys.append(tuple((k.start, k.stop) for k in key))
+        return self.data[key]
+
+
+def _z_block(z: int) -> tuple[slice, ...]:
+    """Key for the single-plane chunk at `z` of a (1, Z, 4, 4) array."""
+    return (slice(0, 1), slice(z, z + 1), slice(0, 4), slice(0, 4))
+
+
+def test_prefetching_zarr_warms_neighbour_planes():
+    """
+    A chunk read should prefetch the Z±1/±2 chunks into the cache, and a
+    later read of a neighbour should be served without touching storage.
+    """
+    from napari_ome_arrow._reader import _PrefetchingZarr
+
+    inner = _RecordingArray(
+        np.arange(10 * 16, dtype=np.uint16).reshape(1, 10, 4, 4),
+        chunks=(1, 1, 4, 4),
+    )
+    arr = _PrefetchingZarr(inner, max_distance=(0, 2, 0, 0))
+
+    arr[_z_block(5)]
+    with arr._lock:
+        pending = list(arr._pending.values())
+    concurrent.futures.wait(pending, timeout=10)
+
+    neighbours = {((0, 1), (z, z + 1), (0, 4), (0, 4)) for z in (3, 4, 6, 7)}
+    assert neighbours <= set(arr._cache)
+
+    key_6 = ((0, 1), (6, 7), (0, 4), (0, 4))
+    np.testing.assert_array_equal(arr[_z_block(6)], inner.data[_z_block(6)])
+    # only the prefetch read chunk 6; the foreground read hit the cache
+    assert inner.keys.count(key_6) == 1
+
+
+def test_prefetching_zarr_waits_for_running_prefetch():
+    """
+    Moving onto a chunk whose prefetch is still running should wait for
+    that read instead of fetching the chunk from storage a second time.
+    """
+    from napari_ome_arrow._reader import _PrefetchingZarr
+
+    inner = _RecordingArray(
+        np.arange(10 * 16, dtype=np.uint16).reshape(1, 10, 4, 4),
+        chunks=(1, 1, 4, 4),
+    )
+    arr = _PrefetchingZarr(inner, max_distance=(0, 1, 0, 0))
+    key_6 = ((0, 1), (6, 7), (0, 4), (0, 4))
+
+    inner.gate.clear()  # hold prefetch reads in flight
+    try:
+        arr[_z_block(5)]
+        for _ in range(1000):
+            if key_6 in inner.prefetch_started:
+                break
+            time.sleep(0.01)
+        assert key_6 in inner.prefetch_started
+
+        result = {}
+        reader = threading.Thread(
+            target=lambda: result.setdefault("z6", arr[_z_block(6)])
+        )
+        reader.start()
+        reader.join(timeout=0.2)  # blocked behind the held prefetch
+    finally:
+        inner.gate.set()
+    reader.join(timeout=10)
+    with arr._lock:
+        pending = list(arr._pending.values())
+    concurrent.futures.wait(pending, timeout=10)
+
+    np.testing.assert_array_equal(result["z6"], inner.data[_z_block(6)])
+    assert inner.keys.count(key_6) == 1
+
+
+def test_prefetching_zarr_cache_is_bounded_by_bytes():
+    """
+    The chunk cache should stay within its byte budget however many
+    planes are visited, and prefetch no more chunks than fit in it.
+    """
+    from napari_ome_arrow._reader import _PrefetchingZarr
+
+    inner = _RecordingArray(
+        np.zeros((1, 20, 4, 4), dtype=np.uint16), chunks=(1, 1, 4, 4)
+    )
+    chunk_nbytes = 4 * 4 * 2
+    arr = _PrefetchingZarr(
+        inner, max_distance=(0, 2, 0, 0), cache_bytes=3 * chunk_nbytes
+    )
+    assert arr._max_chunks == 2
+
+    for z in range(20):
+        arr[_z_block(z)]
+        with arr._lock:
+            pending = list(arr._pending.values())
+        concurrent.futures.wait(pending, timeout=10)
+        with arr._lock:
+            cached = sum(chunk.nbytes for chunk in arr._cache.values())
+        assert cached <= 3 * chunk_nbytes
+
+
+def test_prefetching_zarr_bounds_in_flight_reads():
+    """
+    Scrubbing through planes while storage is slow should keep at most
+    `max_chunks` prefetches pending and cancel the out-of-range ones
+    instead of reading them later.
+    """
+    from napari_ome_arrow._reader import _PrefetchingZarr
+
+    inner = _RecordingArray(
+        np.zeros((1, 20, 4, 4), dtype=np.uint8), chunks=(1, 1, 4, 4)
+    )
+    arr = _PrefetchingZarr(inner, max_distance=(0, 1, 0, 0), max_chunks=2)
+
+    inner.gate.clear()  # hold prefetch reads in flight
+    try:
+        for z in range(20):
+            arr[_z_block(z)]
+            assert len(arr._pending) <= 2
+    finally:
+        inner.gate.set()
+    with arr._lock:
+        pending = list(arr._pending.values())
+    concurrent.futures.wait(pending, timeout=10)
+
+    # blocked reads plus at most the final pending pair; the rest of the
+    # scrub was cancelled rather than drained
+    assert inner.prefetch_reads <= 4
+
+
+@pytest.mark.parametrize(
+    "force_u16, expected", [(None, np.float32), ("1", np.uint16)]
+)
+def test_reader_ome_zarr_lazy_dtype(
+    tmp_path: Path, force_u16: str | None, expected: type
+):
+    """
+    Lazy OME-Zarr levels keep the store dtype, and honour
+    NAPARI_OME_ARROW_FORCE_U16 without computing anything up front.
+    """
+    da = pytest.importorskip("dask.array")
+    zarr = pytest.importorskip("zarr")
+    path = tmp_path / "float.ome.zarr"
+    original = (np.arange(2 * 3 * 8 * 8) % 200).astype(np.float32)
+    original = original.reshape(2, 3, 8, 8)
+    group = zarr.open_group(str(path), mode="w")
+    group.create_array("0", data=original, chunks=(1, 1, 8, 8))
+    group.attrs["ome"] = {
+        "version": "0.5",
+        "multiscales": [
+            {
+                "axes": [{"name": a} for a in "czyx"],
+                "datasets": [{"path": "0"}],
+            }
+        ],
+    }
+
+    with (
+        temporary_env_var("NAPARI_OME_ARROW_LAYER_TYPE", "image"),
+        temporary_env_var("NAPARI_OME_ARROW_FORCE_U16", force_u16),
+    ):
+        data, _, _ = napari_get_reader(str(path))(str(path))[0]
+
+    assert isinstance(data, da.Array)
+    assert data.dtype == np.dtype(expected)
+    np.testing.assert_array_equal(data[0].compute(), original.astype(expected))
+
+
+def test_reader_ome_zarr_eager_env_var():
+    """NAPARI_OME_ARROW_EAGER=1 should restore the in-memory NumPy path."""
+    path = _p("idr0062A", "6001240_labels.zarr")
+
+    with (
+        temporary_env_var("NAPARI_OME_ARROW_LAYER_TYPE", "labels"),
+        temporary_env_var("NAPARI_OME_ARROW_EAGER", "1"),
+    ):
+        reader = napari_get_reader(path)
+        assert callable(reader)
+        data, add_kwargs, layer_type = reader(path)[0]
+
+    assert layer_type == "labels"
+    assert isinstance(data, np.ndarray)
+    assert np.issubdtype(data.dtype, np.integer)
+    assert "channel_axis" not in add_kwargs
+
+
 # --------------------------------------------------------------------- #
 #  .npy fallback behavior
 # --------------------------------------------------------------------- #
@@ -170,6 +595,20 @@ def test_reader_npy_image_mode(tmp_path: Path):
     np.testing.assert_allclose(original, data)
 
 
+def test_reader_accepts_pathlib_paths(tmp_path: Path):
+    """Path objects (alone or in a list) should work like plain strings."""
+    my_test_file = tmp_path / "pathlike.npy"
+    np.save(my_test_file, np.zeros((8, 8), dtype=np.uint8))
+
+    with temporary_env_var("NAPARI_OME_ARROW_LAYER_TYPE", "image"):
+        reader = napari_get_reader(my_test_file)
+        assert callable(reader)
+        (_, single_kwargs, _) = reader(my_test_file)[0]
+        (_, list_kwargs, _) = reader([my_test_file])[0]
+
+    assert single_kwargs["name"] == list_kwargs["name"] == "pathlike.npy"
+
+
 def test_reader_npy_labels_mode(tmp_path: Path):
     """
     .npy fallback should support labels mode, converting to integer labels.
@@ -192,6 +631,168 @@ def test_reader_npy_labels_mode(tmp_path: Path):
     assert np.issubdtype(data.dtype, np.integer)
 
 
+def test_reader_npy_labels_are_editable(tmp_path: Path):
+    """
+    Integer labels from a .npy must accept painting (napari writes into
+    the layer data) without modifying the file on disk.
+    """
+    my_test_file = tmp_path / "paint.npy"
+    np.save(my_test_file, np.zeros((16, 16), dtype=np.uint16))
+
+    with temporary_env_var("NAPARI_OME_ARROW_LAYER_TYPE", "labels"):
+        data, _, _ = napari_get_reader(str(my_test_file))(str(my_test_file))[0]
+
+    assert data.flags.writeable
+    data[0, 0] = 3
+    assert data[0, 0] == 3
+    assert np.load(my_test_file)[0, 0] == 0
+
+
+def test_reader_npy_labels_mode_rounds_floats(tmp_path: Path):
+    """
+    Float labels should round to the nearest integer, with NaN and inf
+    mapped to background (0), across block boundaries.
+    """
+    with temporary_env_var("NAPARI_OME_ARROW_LAYER_TYPE", "labels"):
+        my_test_file = tmp_path / "float_labels.npy"
+        original = np.random.rand(3, 1024, 1024).astype(np.float32) * 50
+        original[0, 0, :3] = [np.nan, np.inf, -np.inf]
+        np.save(my_test_file, original)
+
+        data, _, _ = napari_get_reader(str(my_test_file))(str(my_test_file))[0]
+
+    expected = np.round(np.nan_to_num(original, nan=0, posinf=0, neginf=0))
+    assert data.dtype == np.int32
+    np.testing.assert_array_equal(data, expected.astype(np.int32))
+
+
+@pytest.mark.parametrize(
+    "npy_axes, expected_channel_axis",
+    [(None, None), ("CYX", 0), ("YXC", 2)],
+)
+def test_reader_npy_3d_axes(
+    tmp_path: Path, npy_axes: str | None, expected_channel_axis: int | None
+):
+    """
+    A small 3D .npy is a Z-stack unless NAPARI_OME_ARROW_NPY_AXES says
+    where the channel axis is; its size alone is never used as a hint.
+    """
+    my_test_file = tmp_path / "stack.npy"
+    np.save(my_test_file, np.zeros((4, 16, 16), dtype=np.uint8))
+
+    with (
+        temporary_env_var("NAPARI_OME_ARROW_LAYER_TYPE", "image"),
+        temporary_env_var("NAPARI_OME_ARROW_NPY_AXES", npy_axes),
+    ):
+        _, add_kwargs, _ = napari_get_reader(str(my_test_file))(
+            str(my_test_file)
+        )[0]
+
+    assert add_kwargs.get("channel_axis") == expected_channel_axis
+
+
+@pytest.mark.parametrize("mode", ["image", "labels"])
+def test_reader_npy_4d_keeps_every_plane(tmp_path: Path, mode: str):
+    """
+    Without NAPARI_OME_ARROW_NPY_AXES a 4D .npy is TZYX: no channel axis
+    is split off in image mode and labels keep every timepoint.
+    """
+    my_test_file = tmp_path / "tzyx.npy"
+    original = np.arange(2 * 3 * 16 * 16, dtype=np.uint16).reshape(
+        2, 3, 16, 16
+    )
+    np.save(my_test_file, original)
+
+    with (
+        temporary_env_var("NAPARI_OME_ARROW_LAYER_TYPE", mode),
+        temporary_env_var("NAPARI_OME_ARROW_NPY_AXES", None),
+    ):
+        data, add_kwargs, layer_type = napari_get_reader(str(my_test_file))(
+            str(my_test_file)
+        )[0]
+
+    assert layer_type == mode
+    assert "channel_axis" not in add_kwargs
+    np.testing.assert_array_equal(data, original)
+
+
+def test_reader_npy_flat_square_is_reshaped(tmp_path: Path):
+    """A 1D .npy with a perfect-square length is recovered as a 2D image."""
+    with temporary_env_var("NAPARI_OME_ARROW_LAYER_TYPE", "image"):
+        my_test_file = tmp_path / "flat.npy"
+        original = np.arange(64 * 64, dtype=np.uint16)
+        np.save(my_test_file, original)
+
+        data, _, _ = napari_get_reader(str(my_test_file))(str(my_test_file))[0]
+
+    assert data.shape == (64, 64)
+    assert not data.flags.owndata  # a view of the file, not a copy
+    np.testing.assert_array_equal(data.ravel(), original)
+
+
+@pytest.mark.parametrize(
+    "mode, shape, npy_axes",
+    [
+        ("image", (16, 16), None),
+        ("image", (256,), None),  # flat square: reshaped view
+        ("labels", (16, 16), None),
+        ("labels", (2, 16, 16), "CYX"),  # first channel: sliced view
+    ],
+)
+def test_reader_npy_returns_memmap(
+    tmp_path: Path, mode: str, shape: tuple[int, ...], npy_axes: str | None
+):
+    """
+    Integer .npy data should reach napari as the np.memmap itself (or a
+    view of it), never as a materialized in-memory copy. Labels must
+    still be paintable without writing back to the file.
+    """
+    my_test_file = tmp_path / "mapped.npy"
+    np.save(
+        my_test_file, np.arange(np.prod(shape), dtype=np.uint16).reshape(shape)
+    )
+
+    with (
+        temporary_env_var("NAPARI_OME_ARROW_LAYER_TYPE", mode),
+        temporary_env_var("NAPARI_OME_ARROW_NPY_AXES", npy_axes),
+    ):
+        data, _, layer_type = napari_get_reader(str(my_test_file))(
+            str(my_test_file)
+        )[0]
+
+    assert layer_type == mode
+    assert isinstance(data, np.memmap)
+    assert not data.flags.owndata
+    if mode == "labels":
+        corner = (0,) * data.ndim
+        data[corner] = 7
+        assert data[corner] == 7
+        assert np.load(my_test_file).ravel()[0] == 0
+
+
+def test_reader_npy_is_memory_mapped(tmp_path: Path):
+    """
+    Opening a large .npy should not read the whole file into memory.
+    """
+    psutil = pytest.importorskip("psutil")
+    my_test_file = tmp_path / "large.npy"
+    # 256 MB on disk; open_memmap leaves the payload sparse
+    mm = np.lib.format.open_memmap(
+        my_test_file, mode="w+", dtype=np.uint16, shape=(8, 4096, 4096)
+    )
+    nbytes = mm.nbytes
+    del mm
+
+    process = psutil.Process()
+    with temporary_env_var("NAPARI_OME_ARROW_LAYER_TYPE", "image"):
+        rss_before = process.memory_info().rss
+        data, _, _ = napari_get_reader(str(my_test_file))(str(my_test_file))[0]
+        rss_after = process.memory_info().rss
+
+    assert data.shape == (8, 4096, 4096)
+    assert rss_after - rss_before < nbytes // 4
+
+
 # --------------------------------------------------------------------- #
 #  Auto-3D behavior for Z-stacks (no monkeypatch)
 # --------------------------------------------------------------------- #
@@ -229,3 +830,32 @@ def test_z_stack_switches_viewer_to_3d():
         finally:
             # Clean up viewer so the test doesn't leak windows/resources
             viewer.close()
+
+
+@pytest.mark.skipif(
+    "CI" in os.environ and os.environ["CI"].lower() == "true",
+    reason="May require a functional Qt backend; skip in CI by default.",
+)
+@pytest.mark.parametrize("npy_axes", ["CYX", "YXC"])
+def test_multichannel_2d_npy_stays_2d(tmp_path: Path, npy_axes: str):
+    """
+    A 2D multi-channel .npy has no Z axis, so the viewer must stay in 2D
+    whichever position NAPARI_OME_ARROW_NPY_AXES gives the channels.
+    """
+    napari = pytest.importorskip("napari")
+
+    my_test_file = tmp_path / "channels.npy"
+    shape = (2, 16, 16) if npy_axes == "CYX" else (16, 16, 2)
+    np.save(my_test_file, np.zeros(shape, dtype=np.uint8))
+
+    with (
+        temporary_env_var("NAPARI_OME_ARROW_LAYER_TYPE", "image"),
+        temporary_env_var("NAPARI_OME_ARROW_NPY_AXES", npy_axes),
+    ):
+        viewer = napari.Viewer()
+        try:
+            viewer.dims.ndisplay = 2
+            _ = napari_get_reader(str(my_test_file))(str(my_test_file))
+            assert viewer.dims.ndisplay == 2
+        finally:
+            viewer.close()